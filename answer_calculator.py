@@ -1,25 +1,136 @@
+import re
+from collections import OrderedDict
+from fractions import Fraction
+
+
 class AnswerCalculator:
     """
     解析表达式并计算正确的符号。
+
+    支持整数、小数、分数以及四则运算表达式（例如 '3/4'、'0.7'、'12+5'），
+    所有计算均使用 Fraction 进行精确的有理数运算，避免浮点误差。
     """
-    def __init__(self, logger):
+    # OCR 常见的运算符写法统一为标准运算符
+    OPERATOR_ALIASES = {
+        '×': '*', 'x': '*', 'X': '*',
+        '÷': '/', ':': '/',
+        '−': '-', '—': '-', '–': '-',
+        '（': '(', '）': ')',
+    }
+    TOKEN_PATTERN = re.compile(r'\s*(?:(\d+(?:\.\d+)?|\.\d+)|(.))')
+    # OCR 常在首尾多识别出标点，例如 '12.'、'12,'
+    LEADING_NOISE = re.compile(r'^(?:\s|[.,](?!\d))+')
+    TRAILING_NOISE = re.compile(r'[\s.,]+$')
+    # 首尾残留的运算符说明表达式被截断，例如 '3/'、'12+'，不能当作完整的数字
+    DANGLING_OPERATOR = re.compile(r'^[+*/]|[+\-*/]$')
+    SYMBOLS = ('<', '=', '>')
+
+    def __init__(self, logger, cache_size=256):
         """
         初始化答案计算器。
 
         :param logger: FormattedLogger实例，用于记录日志
+        :param cache_size: 表达式解析结果缓存的最大条目数
         """
         self.logger = logger
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+
+    def tokenize(self, expression):
+        """
+        将表达式字符串切分为数字和运算符。
+
+        :param expression: 表达式字符串，例如 '12+5'
+        :return: 记号列表，数字为 Fraction，运算符为字符串
+        """
+        for alias, operator in self.OPERATOR_ALIASES.items():
+            expression = expression.replace(alias, operator)
+        expression = self.LEADING_NOISE.sub('', expression)
+        expression = self.TRAILING_NOISE.sub('', expression)
+        if self.DANGLING_OPERATOR.search(expression):
+            raise ValueError(f"表达式不完整: {expression}")
+
+        tokens = []
+        for number, symbol in self.TOKEN_PATTERN.findall(expression):
+            if number:
+                tokens.append(Fraction(number))
+            elif symbol in '+-*/()':
+                tokens.append(symbol)
+            elif not symbol.isspace():
+                raise ValueError(f"无法识别的字符: {symbol!r}")
+        if not tokens:
+            raise ValueError("表达式为空")
+        return tokens
+
+    def evaluate(self, expression):
+        """
+        计算表达式的精确值，结果会被缓存。
+
+        :param expression: 表达式字符串，例如 '3/4'
+        :return: Fraction 类型的计算结果
+        """
+        key = expression.strip()
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        tokens = self.tokenize(key)
+        value, position = self._parse_sum(tokens, 0)
+        if position != len(tokens):
+            raise ValueError(f"表达式中存在多余的内容: {tokens[position]}")
+
+        self._cache[key] = value
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return value
+
+    def _parse_sum(self, tokens, position):
+        value, position = self._parse_product(tokens, position)
+        while position < len(tokens) and tokens[position] in ('+', '-'):
+            operator = tokens[position]
+            right, position = self._parse_product(tokens, position + 1)
+            value = value + right if operator == '+' else value - right
+        return value, position
+
+    def _parse_product(self, tokens, position):
+        value, position = self._parse_unary(tokens, position)
+        while position < len(tokens) and tokens[position] in ('*', '/'):
+            operator = tokens[position]
+            right, position = self._parse_unary(tokens, position + 1)
+            if operator == '*':
+                value = value * right
+            elif right == 0:
+                raise ZeroDivisionError("除数为零")
+            else:
+                value = value / right
+        return value, position
+
+    def _parse_unary(self, tokens, position):
+        if position >= len(tokens):
+            raise ValueError("表达式不完整")
+        token = tokens[position]
+        if token == '-':
+            value, position = self._parse_unary(tokens, position + 1)
+            return -value, position
+        if token == '(':
+            value, position = self._parse_sum(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ')':
+                raise ValueError("括号不匹配")
+            return value, position + 1
+        if isinstance(token, Fraction):
+            return token, position + 1
+        raise ValueError(f"意外的符号: {token}")
 
     def parse_expression(self, digits):
         """
-        解析OCR识别到的数字列表。
+        解析OCR识别到的表达式列表。
 
-        :param digits: 数字列表，例如 ['3', '2']
+        :param digits: 表达式列表，例如 ['3', '2']、['3/4', '0.7']
         :return: a, b
         """
         try:
-            if isinstance(digits, list) and len(digits) >= 2 and all(isinstance(d, str) and d.isdigit() for d in digits):
-                a, b = int(digits[0]), int(digits[1])
+            if isinstance(digits, list) and len(digits) >= 2 and all(isinstance(d, str) for d in digits):
+                a, b = self.evaluate(digits[0]), self.evaluate(digits[1])
                 self.logger.log('DEBUG', 'AnswerCalculator: parse_expression', f"解析表达式: {a} 和 {b}")
                 return a, b
             else:
@@ -49,3 +160,27 @@ class AnswerCalculator:
         except Exception as e:
             self.logger.log('ERROR', 'AnswerCalculator: calculate_answer', f"计算答案时出错: {e}")
             return 'error'
+
+    def calculate_batch(self, pairs):
+        """
+        批量计算多组表达式的符号，用于回放和性能测试。
+
+        先统一求出所有表达式的值，再一次性比较，过程中不逐条记录日志。
+
+        :param pairs: 表达式对列表，例如 [('3/4', '0.7'), ('12+5', '18')]
+        :return: 符号列表，与输入一一对应，无法解析的表达式对为 None
+        """
+        values = []
+        for pair in pairs:
+            if not (isinstance(pair, (list, tuple)) and len(pair) == 2 and all(isinstance(e, str) for e in pair)):
+                values.append(None)
+                continue
+            try:
+                values.append((self.evaluate(pair[0]), self.evaluate(pair[1])))
+            except (ValueError, ZeroDivisionError):
+                values.append(None)
+
+        answers = [None if v is None else self.SYMBOLS[(v[0] > v[1]) - (v[0] < v[1]) + 1] for v in values]
+        failed = answers.count(None)
+        self.logger.log('DEBUG', 'AnswerCalculator: calculate_batch', f"批量计算完成: {len(pairs)} 组，失败 {failed} 组")
+        return answers
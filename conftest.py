@@ -0,0 +1,14 @@
+import pytest
+
+
+class DummyLogger:
+    def __init__(self):
+        self.records = []
+
+    def log(self, level, class_method, message):
+        self.records.append((level, class_method, message))
+
+
+@pytest.fixture
+def logger():
+    return DummyLogger()
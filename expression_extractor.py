@@ -0,0 +1,43 @@
+import re
+
+from answer_calculator import AnswerCalculator
+
+
+class ExpressionExtractor:
+    """
+    从OCR文本中提取表达式，不依赖 OCR 模型。
+
+    允许的运算符与 AnswerCalculator 保持一致，别名由 AnswerCalculator 统一处理。
+    """
+    OPERATOR_CLASS = re.escape(''.join(sorted(set('+-*/()') | set(AnswerCalculator.OPERATOR_ALIASES))))
+    EXPRESSION_PATTERN = re.compile(rf'[\d.{OPERATOR_CLASS}]+')
+    # 运算符两侧的空白会被去掉，使 '12 + 5' 成为一个连续的表达式
+    OPERATOR_SPACING = re.compile(rf'\s*([{OPERATOR_CLASS}])\s*')
+
+    def __init__(self, logger):
+        """
+        初始化表达式提取器。
+
+        :param logger: FormattedLogger实例，用于记录日志
+        """
+        self.logger = logger
+
+    def extract_expression(self, text):
+        """
+        从单个区域的OCR文本中提取唯一一个连续的表达式。
+
+        数字之间仅以空白或其他字符分隔时（例如 '3 4'、'8 ○ 9'）无法确定哪个才是题目，
+        此时返回 None，而不是把它们拼接成一个错误的数字。
+
+        :param text: OCR 识别到的文本
+        :return: 表达式字符串，无法确定时为 None
+        """
+        text = self.OPERATOR_SPACING.sub(r'\1', text.strip())
+        candidates = [m for m in self.EXPRESSION_PATTERN.findall(text) if re.search(r'\d', m)]
+        if not candidates:
+            self.logger.log('ERROR', 'ExpressionExtractor: extract_expression', "OCR 结果中未找到数字。")
+            return None
+        if len(candidates) > 1:
+            self.logger.log('ERROR', 'ExpressionExtractor: extract_expression', f"OCR 结果中包含多个表达式: {text}")
+            return None
+        return candidates[0]
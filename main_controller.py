@@ -46,9 +46,9 @@ class MainController:
                 if ocr_result is not None:
                     failure_count = 0  # 重置失败计数
                     num1, num2 = ocr_result  # 解包两个数字
-                    self.logger.log('INFO', 'MainController: run', f"OCR 识别到的数字: {num1} 和 {num2}")
+                    self.logger.log('INFO', 'MainController: run', f"OCR 识别到的表达式: {num1} 和 {num2}")
 
-                    # 解析表达式，获取两个数字
+                    # 解析表达式，获取两个数值
                     a, b = self.answer_calculator.parse_expression([str(num1), str(num2)])
                     if a is None or b is None:
                         self.logger.log('ERROR', 'MainController: run', "解析表达式失败，跳过此次循环。")
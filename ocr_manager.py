@@ -3,11 +3,13 @@ from PIL import Image, ImageEnhance, ImageFilter
 import torch
 import re
 from concurrent.futures import ThreadPoolExecutor
+from expression_extractor import ExpressionExtractor
 
 class OCRManager:
     def __init__(self, logger, config):
         self.logger = logger
         self.config = config
+        self.expression_extractor = ExpressionExtractor(logger)
         # 初始化 OCR 模型
         self.processor = TrOCRProcessor.from_pretrained('microsoft/trocr-base-stage1')
         self.model = VisionEncoderDecoderModel.from_pretrained('microsoft/trocr-base-stage1')
@@ -78,15 +80,13 @@ class OCRManager:
                     ocr_regions.values()
                 ))
 
-            # 处理OCR结果并提取数字
+            # 处理OCR结果并提取表达式（整数、小数、分数或四则运算）
             numbers = []
             for result in ocr_results:
-                digit = re.findall(r'\d+', result)
-                if digit:
-                    numbers.append(digit[0])
-                else:
-                    self.logger.log('ERROR', 'OCRManager: perform_ocr', "OCR 结果中未找到数字。")
+                expression = self.expression_extractor.extract_expression(result)
+                if expression is None:
                     return None
+                numbers.append(expression)
 
             return numbers if len(numbers) == 2 else None
         except Exception as e:
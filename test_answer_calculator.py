@@ -0,0 +1,91 @@
+from fractions import Fraction
+
+import pytest
+
+from answer_calculator import AnswerCalculator
+
+
+@pytest.fixture
+def calculator(logger):
+    return AnswerCalculator(logger)
+
+
+@pytest.mark.parametrize('expression, expected', [
+    ('3/4', Fraction(3, 4)),
+    ('0.7', Fraction(7, 10)),
+    ('12+5', Fraction(17)),
+    ('.5', Fraction(1, 2)),
+    ('2×3', Fraction(6)),
+    ('8÷2', Fraction(4)),
+])
+def test_evaluate_request_forms(calculator, expression, expected):
+    assert calculator.evaluate(expression) == expected
+
+
+@pytest.mark.parametrize('expression, expected', [
+    ('2+3*4', Fraction(14)),
+    ('(2+3)*4', Fraction(20)),
+    ('10-4-3', Fraction(3)),
+    ('8/4/2', Fraction(1)),
+    ('-3+5', Fraction(2)),
+    ('2*-3', Fraction(-6)),
+    ('-(1+2)', Fraction(-3)),
+])
+def test_evaluate_precedence_and_unary_minus(calculator, expression, expected):
+    assert calculator.evaluate(expression) == expected
+
+
+def test_evaluate_division_by_zero(calculator):
+    with pytest.raises(ZeroDivisionError):
+        calculator.evaluate('1/0')
+    assert calculator.parse_expression(['1/0', '2']) == (None, None)
+
+
+@pytest.mark.parametrize('expression, expected', [
+    ('12.', Fraction(12)),
+    ('12 .', Fraction(12)),
+    ('12,', Fraction(12)),
+    ('3/4.', Fraction(3, 4)),
+    ('-3', Fraction(-3)),
+])
+def test_evaluate_strips_ocr_punctuation(calculator, expression, expected):
+    assert calculator.evaluate(expression) == expected
+
+
+@pytest.mark.parametrize('expression', ['3/', '/4', '12+', '12 +', '7-', 'x12', '+3'])
+def test_evaluate_rejects_dangling_operator(calculator, expression):
+    with pytest.raises(ValueError):
+        calculator.evaluate(expression)
+
+
+@pytest.mark.parametrize('expression', ['1,000', '3 4', '(1+2', 'a', ''])
+def test_evaluate_rejects_ambiguous_or_invalid(calculator, expression):
+    with pytest.raises(ValueError):
+        calculator.evaluate(expression)
+
+
+def test_cache_evicts_least_recently_used(logger, monkeypatch):
+    calculator = AnswerCalculator(logger, cache_size=2)
+    tokenized = []
+    tokenize = calculator.tokenize
+    monkeypatch.setattr(calculator, 'tokenize', lambda e: tokenized.append(e) or tokenize(e))
+
+    for expression in ['1', '2', '1', '3', '1', '2']:
+        calculator.evaluate(expression)
+    # '1' 在 '3' 加入前被再次访问，因此被淘汰的是 '2'
+    assert tokenized == ['1', '2', '3', '2']
+
+
+def test_calculate_batch_keeps_order_and_none_slots(calculator):
+    pairs = [('3/4', '0.7'), ('12+5', '18'), ('1/0', '2'), ('6', '6'), ('1', '2', '3'), ('3/', '1')]
+    assert calculator.calculate_batch(pairs) == ['>', '<', None, '=', None, None]
+
+
+@pytest.mark.parametrize('pair', ['12', None, ('1', 2), {'1', '2'}])
+def test_calculate_batch_rejects_malformed_pairs(calculator, pair):
+    assert calculator.calculate_batch([pair, ['2', '1']]) == [None, '>']
+
+
+def test_calculate_batch_logs_once(calculator, logger):
+    calculator.calculate_batch([('1', '2'), ('3', '4'), ('5', '6')])
+    assert len(logger.records) == 1
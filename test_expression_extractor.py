@@ -0,0 +1,27 @@
+import pytest
+
+from expression_extractor import ExpressionExtractor
+
+
+@pytest.fixture
+def extractor(logger):
+    return ExpressionExtractor(logger)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('12', '12'),
+    ('12 + 5', '12+5'),
+    ('3 / 4', '3/4'),
+    ('2 × 3', '2×3'),
+    ('（1 + 2）', '（1+2）'),
+    ('0.7', '0.7'),
+    ('12.', '12.'),
+    ('12 .', '12'),
+])
+def test_extract_expression(extractor, text, expected):
+    assert extractor.extract_expression(text) == expected
+
+
+@pytest.mark.parametrize('text', ['3 4', '8 ○ 9', '1,000', 'abc', ''])
+def test_extract_expression_rejects_ambiguous(extractor, text):
+    assert extractor.extract_expression(text) is None